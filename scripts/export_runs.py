@@ -1,29 +1,57 @@
 from __future__ import annotations
 
+import csv
 import logging
 import os
 
-import pandas as pd
 from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
 
 from quant_backtester.logging_utils import configure_logging
 
 DB = os.getenv("DATABASE_URL", "sqlite:///runs/runs.db")
+QUERY = "SELECT * FROM runs ORDER BY created_at DESC"
 logger = logging.getLogger(__name__)
 
 
+def _export_copy(eng: Engine, out: str) -> int:
+    """Postgres fast path: server-side COPY straight into the file."""
+    raw = eng.raw_connection()
+    try:
+        with raw.cursor() as cur, open(out, "w", newline="", encoding="utf-8") as fh:
+            cur.copy_expert(f"COPY ({QUERY}) TO STDOUT WITH CSV HEADER", fh)
+            rows = int(cur.rowcount)
+        raw.commit()
+    finally:
+        raw.close()
+    return rows
+
+
+def _export_stream(eng: Engine, out: str) -> int:
+    """Generic path: stream rows from the cursor straight into csv.writer."""
+    rows = 0
+    with eng.connect() as c, open(out, "w", newline="", encoding="utf-8") as fh:
+        result = c.execute(text(QUERY))
+        writer = csv.writer(fh)
+        writer.writerow(result.keys())
+        for row in result:
+            writer.writerow(row)
+            rows += 1
+    return rows
+
+
 def main() -> None:
     configure_logging(level="INFO", json_logs=bool(os.getenv("CI")))
     logger.info("Export started", extra={"event": {"database_url": DB}})
     eng = create_engine(DB, future=True)
-    with eng.connect() as c:
-        rows = c.execute(text("SELECT * FROM runs ORDER BY created_at DESC")).mappings().all()
-    df = pd.DataFrame(rows)
     out = "runs/runs_export.csv"
     os.makedirs("runs", exist_ok=True)
-    df.to_csv(out, index=False)
-    print(f"Exported {len(df)} rows to {out}")
-    logger.info("Export completed", extra={"event": {"rows": len(df), "out": out}})
+    if eng.dialect.name == "postgresql":
+        rows = _export_copy(eng, out)
+    else:
+        rows = _export_stream(eng, out)
+    print(f"Exported {rows} rows to {out}")
+    logger.info("Export completed", extra={"event": {"rows": rows, "out": out}})
 
 
 if __name__ == "__main__":
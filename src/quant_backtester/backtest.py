@@ -2,18 +2,21 @@ from __future__ import annotations
 
 import datetime as dt
 import logging
-from dataclasses import asdict
 from typing import Any, cast
 
 from quant_backtester.config import BacktestConfig
-from quant_backtester.data.csv_data_handler import CSVDataHandler
+from quant_backtester.data.csv_data_handler import (
+    CSVDataHandler,
+    MarketColumns,
+    events_from_columns,
+)
 from quant_backtester.events import OrderEvent
 from quant_backtester.execution.simulated_execution import SimulatedExecutionHandler
 from quant_backtester.persistence.db import Database
 from quant_backtester.persistence.models import Run
 from quant_backtester.portfolio.simple_portfolio import MultiAssetPortfolio
 from quant_backtester.strategy.moving_average import MovingAverageCrossStrategy
-from quant_backtester.utils.metrics import max_drawdown, returns_from_equity, sharpe_ratio
+from quant_backtester.utils.metrics import returns_from_equity, sharpe_ratio
 
 logger = logging.getLogger(__name__)
 
@@ -47,20 +50,29 @@ def run_to_model(result: dict[str, object]) -> Run:
     )
 
 
-def run_backtest(cfg: BacktestConfig, persist: bool = True) -> dict[str, object]:
+def run_backtest(
+    cfg: BacktestConfig,
+    persist: bool = True,
+    db: Database | None = None,
+    market_columns: MarketColumns | None = None,
+) -> dict[str, object]:
     cfg.ensure_outdir()
     logger.info(
         "Backtest started",
         extra={"event": {"run_name": cfg.run_name, "symbols": cfg.symbols, "persist": persist}},
     )
 
-    db: Database | None = None
-    if persist:
+    if persist and db is None:
         # Alembic recommended for production, but create_all keeps dev UX smooth.
+        # Callers running many backtests should pass a shared Database so the
+        # engine/connection pool and schema check are paid once, not per run.
         db = Database(cfg.database_url)
         db.create_tables()
 
-    data = CSVDataHandler(cfg.csv_path)
+    # Callers that run many backtests over the same data (sweeps, walk-forward
+    # windows) pass pre-parsed columns so the file is read and validated once.
+    if market_columns is None:
+        market_columns = CSVDataHandler(cfg.csv_path).columns(cfg.symbol_set)
     strategy = MovingAverageCrossStrategy(
         symbols=cfg.symbols,
         short_window=cfg.short_window,
@@ -74,12 +86,10 @@ def run_backtest(cfg: BacktestConfig, persist: bool = True) -> dict[str, object]
     portfolio = MultiAssetPortfolio(
         initial_cash=cfg.initial_cash,
         risk_cfg=cfg.risk,
+        expected_marks=len(market_columns),
     )
 
-    for market in data.stream():
-        if market.symbol not in cfg.symbols:
-            continue
-
+    for market in events_from_columns(market_columns):
         portfolio.mark_to_market(market.symbol, market.mid)
 
         # Process fills from microstructure engine (latency/partial fills)
@@ -121,14 +131,19 @@ def run_backtest(cfg: BacktestConfig, persist: bool = True) -> dict[str, object]
     eq = portfolio.equity_curve
     rets = returns_from_equity(eq)
 
-    final_equity = float(eq[-1]) if eq else cfg.initial_cash
+    final_equity = float(eq[-1]) if eq.size else cfg.initial_cash
     total_return = (final_equity / cfg.initial_cash) - 1.0
     sr = sharpe_ratio(rets)
-    mdd = max_drawdown(eq)
+    # The portfolio tracks max drawdown incrementally next to the halt check;
+    # the first mark always equals initial_cash, so this matches a post-hoc
+    # max_drawdown(eq) pass exactly.
+    mdd = portfolio.max_dd
 
+    # The nested dicts are the configs' shared as_dict caches; only the outer
+    # dict is fresh per run. Treat them as read-only.
     extra_payload: dict[str, object] = {
-        "execution": asdict(cfg.execution),
-        "risk": asdict(cfg.risk),
+        "execution": cfg.execution.as_dict(),
+        "risk": cfg.risk.as_dict(),
     }
 
     result: dict[str, object] = {
@@ -151,8 +166,26 @@ def run_backtest(cfg: BacktestConfig, persist: bool = True) -> dict[str, object]
 
     if persist:
         assert db is not None
+        # Build the ORM row straight from the typed locals; run_to_model exists
+        # for callers that only hold the stringly-typed result dict.
+        run_row = Run(
+            run_name=cfg.run_name,
+            symbols=list(cfg.symbols),
+            short_window=cfg.short_window,
+            long_window=cfg.long_window,
+            initial_cash=cfg.initial_cash,
+            final_equity=final_equity,
+            total_return=float(total_return),
+            sharpe=float(sr),
+            max_drawdown=float(mdd),
+            total_commission=float(portfolio.total_commission),
+            total_slippage_cost=float(portfolio.total_slippage_cost),
+            halted=1 if portfolio.risk_state.trading_halted else 0,
+            halt_reason=portfolio.risk_state.halt_reason,
+            extra=extra_payload,
+        )
         with db.session() as s:
-            s.add(run_to_model(result))
+            s.add(run_row)
             s.commit()
 
     logger.info(
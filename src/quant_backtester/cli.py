@@ -3,7 +3,7 @@ from __future__ import annotations
 import argparse
 import json
 import os
-from dataclasses import asdict
+import sys
 from pathlib import Path
 from typing import Any
 
@@ -33,6 +33,19 @@ def _parse_grid(raw: str) -> list[int]:
     return values
 
 
+def _print_json(obj: dict[str, object]) -> None:
+    """Pretty-print a JSON payload, using orjson when installed."""
+    try:
+        import orjson
+    except ImportError:  # pragma: no cover - depends on optional install
+        print(json.dumps(obj, indent=2, sort_keys=True))
+        return
+    sys.stdout.flush()
+    sys.stdout.buffer.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+    sys.stdout.buffer.write(b"\n")
+    sys.stdout.buffer.flush()
+
+
 def _pick(cli_value: Any, file_value: Any, default_value: Any) -> Any:
     if cli_value is not None:
         return cli_value
@@ -96,6 +109,12 @@ def build_parser() -> argparse.ArgumentParser:
     sweep.add_argument("--short-grid", default=None, help="Comma-separated short windows")
     sweep.add_argument("--long-grid", default=None, help="Comma-separated long windows")
     sweep.add_argument("--export-csv", default=None)
+    sweep.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for the sweep (-1 = all cores, 1 = serial)",
+    )
 
     walk_forward = sub.add_parser(
         "walk-forward", parents=[common], help="Run rolling walk-forward optimization"
@@ -110,9 +129,9 @@ def build_parser() -> argparse.ArgumentParser:
     return p
 
 
-def main() -> None:
+def main(argv: list[str] | None = None) -> None:
     parser = build_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     configure_logging(level=args.log_level, json_logs=args.json_logs)
 
     file_cfg: dict[str, Any] = {}
@@ -258,8 +277,8 @@ def main() -> None:
             "out_dir": cfg.out_dir,
             "database_url": cfg.database_url,
             "persist": not bool(args.no_persist),
-            "execution": asdict(cfg.execution),
-            "risk": asdict(cfg.risk),
+            "execution": cfg.execution.as_dict(),
+            "risk": cfg.risk.as_dict(),
         }
         if args.cmd == "sweep":
             effective_config["short_grid"] = short_raw
@@ -278,7 +297,7 @@ def main() -> None:
             )
 
         print("Config valid.")
-        print(json.dumps(effective_config, indent=2, sort_keys=True))
+        _print_json(effective_config)
         return
 
     if args.cmd == "run":
@@ -310,7 +329,11 @@ def main() -> None:
                 long_grid = _parse_grid(str(long_raw))
         except ValueError as exc:
             parser.error(f"Invalid sweep grid: {exc}")
-        df = run_parameter_sweep(cfg, short_grid, long_grid, export_csv=args.export_csv)
+        if args.jobs == 0:
+            parser.error("Invalid --jobs: must be >= 1, or -1 for all cores")
+        df = run_parameter_sweep(
+            cfg, short_grid, long_grid, export_csv=args.export_csv, n_jobs=args.jobs
+        )
         print(df.head(10).to_string(index=False))
         print(f"Saved sweep CSV to: {args.export_csv or (Path(cfg.out_dir) / 'sweep_results.csv')}")
         return
@@ -1,11 +1,26 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, field, fields
 from pathlib import Path
 from typing import Any
 
 
+class _CachedAsDictMixin:
+    """Memoized asdict() for frozen config dataclasses.
+
+    The deep-walk (and its container copies) runs once per instance; callers
+    must treat the returned dict as read-only since it is shared.
+    """
+
+    def as_dict(self) -> dict[str, Any]:
+        cached: dict[str, Any] | None = getattr(self, "_as_dict_cache", None)
+        if cached is None:
+            cached = asdict(self)  # type: ignore[call-overload]
+            object.__setattr__(self, "_as_dict_cache", cached)
+        return cached
+
+
 def _require_range(name: str, value: float, lo: float, hi: float) -> None:
     if not (lo <= value <= hi):
         raise ValueError(f"{name} must be in [{lo}, {hi}], got {value}")
@@ -49,7 +64,7 @@ class MicrostructureConfig:
 
 
 @dataclass(frozen=True)
-class ExecutionConfig:
+class ExecutionConfig(_CachedAsDictMixin):
     # If bid/ask absent, use spread_bps or this fallback.
     default_spread_bps: float = 5.0
 
@@ -67,7 +82,7 @@ class ExecutionConfig:
 
 
 @dataclass(frozen=True)
-class RiskConfig:
+class RiskConfig(_CachedAsDictMixin):
     max_position_per_symbol: int = 1_000
     stop_loss_pct: float = 0.05  # 5% stop from avg cost
     max_drawdown_pct: float = 0.20  # halt if equity drawdown exceeds this
@@ -97,11 +112,15 @@ class BacktestConfig:
     execution: ExecutionConfig = ExecutionConfig()
     risk: RiskConfig = RiskConfig()
 
+    # O(1) membership view of `symbols`, computed once at construction.
+    symbol_set: frozenset[str] = field(init=False, repr=False, compare=False)
+
     def __post_init__(self) -> None:
         if not self.symbols:
             raise ValueError("symbols must not be empty")
         if any(not s.strip() for s in self.symbols):
             raise ValueError("symbols must not contain empty values")
+        object.__setattr__(self, "symbol_set", frozenset(self.symbols))
         _require_positive("initial_cash", self.initial_cash)
         _require_positive("trade_quantity", float(self.trade_quantity))
         _require_non_negative("commission_per_trade", self.commission_per_trade)
@@ -122,6 +141,35 @@ class BacktestConfig:
         if not self.database_url.strip():
             raise ValueError("database_url must not be empty")
 
+    def with_windows(
+        self, short_window: int, long_window: int, run_name: str | None = None
+    ) -> BacktestConfig:
+        """Copy of this config with new MA windows (and optionally run_name).
+
+        Sweeps build one config per grid point; dataclasses.replace would
+        re-run the full __post_init__ validation on every unchanged field,
+        so this copies fields directly and re-validates only what changed.
+        """
+        if short_window <= 0:
+            raise ValueError(f"short_window must be > 0, got {short_window}")
+        if long_window <= 0:
+            raise ValueError(f"long_window must be > 0, got {long_window}")
+        if short_window >= long_window:
+            raise ValueError(
+                f"short_window must be < long_window, got {short_window} and {long_window}"
+            )
+        if run_name is not None and not run_name.strip():
+            raise ValueError("run_name must not be empty")
+
+        new = object.__new__(BacktestConfig)
+        for f in fields(self):
+            object.__setattr__(new, f.name, getattr(self, f.name))
+        object.__setattr__(new, "short_window", short_window)
+        object.__setattr__(new, "long_window", long_window)
+        if run_name is not None:
+            object.__setattr__(new, "run_name", run_name)
+        return new
+
     def ensure_outdir(self) -> Path:
         p = Path(self.out_dir)
         p.mkdir(parents=True, exist_ok=True)
@@ -131,9 +179,16 @@ class BacktestConfig:
 def load_config_file(path: str) -> dict[str, Any]:
     p = Path(path)
     suffix = p.suffix.lower()
-    raw = p.read_text(encoding="utf-8")
     if suffix == ".json":
-        obj = json.loads(raw)
+        # Bytes in, no decode: orjson parses UTF-8 directly (json.loads
+        # accepts bytes too, so the fallback path is identical).
+        raw_bytes = p.read_bytes()
+        try:
+            import orjson
+        except ImportError:  # pragma: no cover - depends on optional install
+            obj = json.loads(raw_bytes)
+        else:
+            obj = orjson.loads(raw_bytes)
         if not isinstance(obj, dict):
             raise ValueError("Top-level JSON config must be an object")
         return obj
@@ -142,7 +197,7 @@ def load_config_file(path: str) -> dict[str, Any]:
             import yaml
         except ImportError as exc:  # pragma: no cover - depends on optional install
             raise ValueError("YAML config requires PyYAML; install `pyyaml`") from exc
-        obj = yaml.safe_load(raw)
+        obj = yaml.safe_load(p.read_text(encoding="utf-8"))
         if not isinstance(obj, dict):
             raise ValueError("Top-level YAML config must be a mapping")
         return obj
@@ -1,15 +1,58 @@
 from __future__ import annotations
 
-import math
-from collections.abc import Iterator
+import sys
+from collections.abc import Callable, Collection, Iterator
 from dataclasses import dataclass
 from datetime import datetime
-from numbers import Real
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 
 from quant_backtester.events import MarketEvent
 
+# Header schema: anything beyond this is optional and validated per column.
+_REQUIRED_COLUMNS = frozenset({"date", "symbol", "mid"})
+
+
+@dataclass(frozen=True)
+class MarketColumns:
+    """Validated market data as SoA (structure-of-arrays) columns.
+
+    Row k of every array describes one tick, already sorted chronologically;
+    `symbol_labels[symbol_codes[k]]` is the tick's symbol. Optional columns
+    are None when absent from the file, with NaN marking missing cells.
+    """
+
+    timestamps: npt.NDArray[np.datetime64]
+    symbol_codes: npt.NDArray[np.intp]
+    symbol_labels: tuple[str, ...]
+    mid: npt.NDArray[np.float64]
+    bid: npt.NDArray[np.float64] | None
+    ask: npt.NDArray[np.float64] | None
+    spread_bps: npt.NDArray[np.float64] | None
+    volume: npt.NDArray[np.float64] | None
+
+    def __len__(self) -> int:
+        return int(self.mid.shape[0])
+
+
+def _numeric_column(raw: pd.Series) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.bool_]]:
+    """Coerce a column to float64 plus a mask of unparseable string cells.
+
+    Mirrors the scalar conversion rules: missing values and non-numeric,
+    non-string objects become NaN; only strings that fail float() count as
+    errors.
+    """
+    num = pd.to_numeric(raw, errors="coerce")
+    arr = num.to_numpy(dtype=np.float64, na_value=np.nan)
+    unparseable = np.isnan(arr) & ~pd.isna(raw).to_numpy()
+    if unparseable.any():
+        for k in np.flatnonzero(unparseable):
+            if not isinstance(raw.iloc[int(k)], str):
+                unparseable[k] = False
+    return arr, unparseable
+
 
 @dataclass(frozen=True)
 class CSVDataHandler:
@@ -20,35 +63,51 @@ class CSVDataHandler:
       - optional: spread_bps (used if bid/ask absent)
       - optional: volume (available per-tick volume for execution simulation)
 
+    Also accepts a `.parquet` file with the same columns (requires pyarrow);
+    repeat loads skip CSV tokenization entirely.
+
     Emits MarketEvent in chronological order.
     """
 
     csv_path: str
 
-    @staticmethod
-    def _to_optional_float(value: object) -> float | None:
-        if value is None or pd.isna(value):
-            return None
-        if isinstance(value, (Real, str)):
-            return float(value)
-        return None
-
-    @staticmethod
-    def _to_required_float(value: object, *, name: str, row_num: int) -> float:
-        if not isinstance(value, (Real, str)):
-            raise ValueError(f"Invalid {name} at row {row_num}: {value!r}")
+    def _read_frame(self) -> pd.DataFrame:
+        """Read the input file, preferring PyArrow's multithreaded parser when installed."""
+        if self.csv_path.lower().endswith(".parquet"):
+            try:
+                from pyarrow import parquet as pa_pq
+            except ImportError as exc:  # pragma: no cover - depends on optional install
+                raise ValueError("Parquet input requires pyarrow; install `pyarrow`") from exc
+            return pa_pq.read_table(self.csv_path).to_pandas()
         try:
-            val = float(value)
-        except ValueError as exc:
-            raise ValueError(f"Invalid {name} at row {row_num}: {value!r}") from exc
-        if not math.isfinite(val):
-            raise ValueError(f"Invalid {name} at row {row_num}: must be finite, got {val!r}")
-        return val
-
-    def stream(self) -> Iterator[MarketEvent]:
-        df = pd.read_csv(self.csv_path)
-        required = {"date", "symbol", "mid"}
-        missing = required - set(df.columns)
+            import pyarrow as pa
+            from pyarrow import csv as pa_csv
+        except ImportError:  # pragma: no cover - depends on optional install
+            return pd.read_csv(self.csv_path)
+        # Pin the known columns' types so Arrow parses straight to float64 /
+        # string instead of inferring per chunk; unknown names are ignored.
+        convert_options = pa_csv.ConvertOptions(
+            column_types={
+                "symbol": pa.string(),
+                "mid": pa.float64(),
+                "bid": pa.float64(),
+                "ask": pa.float64(),
+                "spread_bps": pa.float64(),
+                "volume": pa.float64(),
+            }
+        )
+        try:
+            table = pa_csv.read_csv(self.csv_path, convert_options=convert_options)
+        except Exception:
+            # Fall back to pandas so malformed input keeps producing the
+            # same validation errors downstream.
+            return pd.read_csv(self.csv_path)
+        return table.to_pandas()
+
+    def _load_frame(self, symbols: Collection[str] | None = None) -> pd.DataFrame:
+        """Read, date-validate, sort, and universe-filter the input frame."""
+        df = self._read_frame()
+        missing = _REQUIRED_COLUMNS - set(df.columns)
         if missing:
             raise ValueError(f"CSV missing columns: {sorted(missing)}")
 
@@ -61,67 +120,176 @@ class CSVDataHandler:
             raise ValueError(f"Invalid date at row {first_bad_idx}: {bad_value!r}")
         df = df.sort_values("date")
 
-        has_bid = "bid" in df.columns
-        has_ask = "ask" in df.columns
-        has_spread_bps = "spread_bps" in df.columns
-        has_volume = "volume" in df.columns
-
-        idx = {name: i for i, name in enumerate(df.columns)}
-        i_date = idx["date"]
-        i_symbol = idx["symbol"]
-        i_mid = idx["mid"]
-        i_bid = idx["bid"] if has_bid else -1
-        i_ask = idx["ask"] if has_ask else -1
-        i_spread_bps = idx["spread_bps"] if has_spread_bps else -1
-        i_volume = idx["volume"] if has_volume else -1
-
-        for row_num, row in enumerate(df.itertuples(index=False, name=None), start=1):
-            ts_raw = row[i_date]
-            ts: datetime = ts_raw.to_pydatetime()
-            bid_raw = row[i_bid] if has_bid else None
-            ask_raw = row[i_ask] if has_ask else None
-            spread_bps_raw = row[i_spread_bps] if has_spread_bps else None
-            vol_raw = row[i_volume] if has_volume else None
-
-            mid = self._to_required_float(row[i_mid], name="mid", row_num=row_num)
-            if mid <= 0:
-                raise ValueError(f"Invalid mid at row {row_num}: must be > 0, got {mid}")
-
-            bid = self._to_optional_float(bid_raw)
-            ask = self._to_optional_float(ask_raw)
-            spread_bps = self._to_optional_float(spread_bps_raw)
-            vol = self._to_optional_float(vol_raw)
-
-            if bid is not None and not math.isfinite(bid):
-                raise ValueError(f"Invalid bid at row {row_num}: must be finite, got {bid}")
-            if ask is not None and not math.isfinite(ask):
-                raise ValueError(f"Invalid ask at row {row_num}: must be finite, got {ask}")
-            if bid is not None and bid <= 0:
-                raise ValueError(f"Invalid bid at row {row_num}: must be > 0, got {bid}")
-            if ask is not None and ask <= 0:
-                raise ValueError(f"Invalid ask at row {row_num}: must be > 0, got {ask}")
-            if bid is not None and ask is not None and ask < bid:
-                raise ValueError(
-                    f"Invalid quote at row {row_num}: ask ({ask}) must be >= bid ({bid})"
-                )
-            if spread_bps is not None and not math.isfinite(spread_bps):
-                raise ValueError(
-                    f"Invalid spread_bps at row {row_num}: must be finite, got {spread_bps}"
-                )
-            if spread_bps is not None and spread_bps < 0:
-                raise ValueError(
-                    f"Invalid spread_bps at row {row_num}: must be >= 0, got {spread_bps}"
-                )
-            if vol is not None and not math.isfinite(vol):
-                raise ValueError(f"Invalid volume at row {row_num}: must be finite, got {vol}")
-            if vol is not None and vol < 0:
-                raise ValueError(f"Invalid volume at row {row_num}: must be >= 0, got {vol}")
-            yield MarketEvent(
-                timestamp=ts,
-                symbol=str(row[i_symbol]),
-                mid=mid,
-                bid=bid,
-                ask=ask,
-                spread_bps=spread_bps,
-                volume=vol,
+        # Filter to the trading universe with a single vectorized mask instead of a
+        # per-event membership check in the backtest loop.
+        if symbols is not None:
+            df = df[df["symbol"].isin(symbols)]
+        return df
+
+    def _extract_columns(self, df: pd.DataFrame) -> MarketColumns:
+        """Convert a loaded frame to validated SoA arrays.
+
+        All value validation is vectorized; when several cells are invalid the
+        error reported matches the scalar path's row-major, check-order
+        precedence.
+        """
+        # (row, check order) candidates; the winner is the lowest row, then
+        # the earliest check within that row.
+        candidates: list[tuple[int, int, ValueError]] = []
+
+        def note(
+            mask: npt.NDArray[np.bool_], priority: int, make: Callable[[int], ValueError]
+        ) -> None:
+            if bool(np.any(mask)):
+                idx = int(np.argmax(mask))
+                candidates.append((idx, priority, make(idx)))
+
+        mid_raw = df["mid"]
+        mid, mid_unparseable = _numeric_column(mid_raw)
+        note(
+            mid_unparseable,
+            0,
+            lambda k: ValueError(f"Invalid mid at row {k + 1}: {mid_raw.iloc[k]!r}"),
+        )
+        note(
+            ~np.isfinite(mid) & ~mid_unparseable,
+            1,
+            lambda k: ValueError(
+                f"Invalid mid at row {k + 1}: must be finite, got {float(mid[k])!r}"
+            ),
+        )
+        with np.errstate(invalid="ignore"):
+            note(
+                mid <= 0,
+                2,
+                lambda k: ValueError(
+                    f"Invalid mid at row {k + 1}: must be > 0, got {float(mid[k])}"
+                ),
             )
+
+        optional: dict[str, npt.NDArray[np.float64] | None] = {}
+        for col_idx, name in enumerate(("bid", "ask", "spread_bps", "volume")):
+            if name not in df.columns:
+                optional[name] = None
+                continue
+            raw = df[name]
+            arr, unparseable = _numeric_column(raw)
+
+            def conversion_error(k: int, raw: pd.Series = raw) -> ValueError:
+                try:
+                    float(raw.iloc[k])
+                except ValueError as exc:
+                    return ValueError(str(exc))
+                return ValueError(f"Invalid value at row {k + 1}: {raw.iloc[k]!r}")
+
+            note(unparseable, 3 + col_idx, conversion_error)
+            optional[name] = arr
+
+        bid = optional["bid"]
+        ask = optional["ask"]
+        spread_bps = optional["spread_bps"]
+        volume = optional["volume"]
+
+        def _note_checks(
+            arr: npt.NDArray[np.float64] | None, name: str, base: int, lower_exclusive: bool
+        ) -> None:
+            if arr is None:
+                return
+            note(
+                np.isinf(arr),
+                base,
+                lambda k: ValueError(
+                    f"Invalid {name} at row {k + 1}: must be finite, got {float(arr[k])}"
+                ),
+            )
+            with np.errstate(invalid="ignore"):
+                if lower_exclusive:
+                    bad_range = arr <= 0
+                    bound = "> 0"
+                else:
+                    bad_range = arr < 0
+                    bound = ">= 0"
+            note(
+                bad_range,
+                base + 2,
+                lambda k: ValueError(
+                    f"Invalid {name} at row {k + 1}: must be {bound}, got {float(arr[k])}"
+                ),
+            )
+
+        _note_checks(bid, "bid", 7, lower_exclusive=True)
+        _note_checks(ask, "ask", 8, lower_exclusive=True)
+        if bid is not None and ask is not None:
+            with np.errstate(invalid="ignore"):
+                crossed = ask < bid
+            note(
+                crossed,
+                11,
+                lambda k: ValueError(
+                    f"Invalid quote at row {k + 1}: ask ({float(ask[k])}) must be >= "
+                    f"bid ({float(bid[k])})"
+                ),
+            )
+        _note_checks(spread_bps, "spread_bps", 12, lower_exclusive=False)
+        _note_checks(volume, "volume", 14, lower_exclusive=False)
+
+        if candidates:
+            candidates.sort(key=lambda c: (c[0], c[1]))
+            raise candidates[0][2]
+
+        symbol_codes, symbol_uniques = pd.factorize(df["symbol"])
+        return MarketColumns(
+            timestamps=df["date"].to_numpy(),
+            symbol_codes=symbol_codes.astype(np.intp, copy=False),
+            # Interned labels: downstream dict lookups keyed by event.symbol
+            # hit the identity fast path instead of comparing characters.
+            symbol_labels=tuple(sys.intern(str(u)) for u in symbol_uniques),
+            mid=mid,
+            bid=bid,
+            ask=ask,
+            spread_bps=spread_bps,
+            volume=volume,
+        )
+
+    def columns(self, symbols: Collection[str] | None = None) -> MarketColumns:
+        """Load the file once and return validated columnar arrays.
+
+        Batch consumers (research, sweeps) should prefer this over stream():
+        it skips per-event object allocation entirely.
+        """
+        return self._extract_columns(self._load_frame(symbols))
+
+    def stream(self, symbols: Collection[str] | None = None) -> Iterator[MarketEvent]:
+        return events_from_columns(self.columns(symbols))
+
+
+def events_from_columns(cols: MarketColumns) -> Iterator[MarketEvent]:
+    """Materialize MarketEvents from validated columns.
+
+    Split out from stream() so callers that parse once (sweeps, walk-forward
+    windows) can replay the same MarketColumns without touching the file
+    again.
+    """
+    n = len(cols)
+
+    def optional_values(arr: npt.NDArray[np.float64] | None) -> list[float | None]:
+        if arr is None:
+            return [None] * n
+        # NaN marks a missing cell in the validated columns (x != x).
+        return [None if x != x else x for x in arr.tolist()]
+
+    timestamps: list[datetime] = cols.timestamps.astype("datetime64[us]").tolist()
+    labels = cols.symbol_labels
+    rows = zip(
+        timestamps,
+        cols.symbol_codes.tolist(),
+        cols.mid.tolist(),
+        optional_values(cols.bid),
+        optional_values(cols.ask),
+        optional_values(cols.spread_bps),
+        optional_values(cols.volume),
+        strict=True,
+    )
+    # Positional construction: kwargs cost a dict build + match per event.
+    for ts, code, mid, bid, ask, spread_bps, vol in rows:
+        yield MarketEvent(ts, labels[code], mid, bid, ask, spread_bps, vol)
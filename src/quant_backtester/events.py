@@ -15,7 +15,7 @@ class Side(StrEnum):
         return 1 if self == Side.BUY else -1
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MarketEvent:
     timestamp: datetime
     symbol: str
@@ -26,14 +26,14 @@ class MarketEvent:
     volume: float | None = None  # per-tick available volume (shares)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SignalEvent:
     timestamp: datetime
     symbol: str
     side: Side
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrderEvent:
     timestamp: datetime
     symbol: str
@@ -43,7 +43,7 @@ class OrderEvent:
     limit_price: float | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FillEvent:
     timestamp: datetime
     symbol: str
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
-import random
-from collections import deque
 from dataclasses import dataclass, field
 
+import numpy as np
+import numpy.typing as npt
+
 from quant_backtester.config import ExecutionConfig
-from quant_backtester.events import FillEvent, MarketEvent, OrderEvent
+from quant_backtester.events import FillEvent, MarketEvent, OrderEvent, Side
+
+# Uniform draws are generated in batches; one PCG64 call per 4096 events
+# instead of one Python-level RNG call per event.
+_RNG_BATCH_SIZE = 4096
 
 
 @dataclass
@@ -13,6 +18,9 @@ class _PendingOrder:
     order: OrderEvent
     submitted_tick: int
     remaining: int
+    # +1 for BUY, -1 for SELL; resolved once at submit so the per-tick hot
+    # path branches on an int instead of a StrEnum string compare.
+    side_sign: int
     commission_charged: bool = False
 
 
@@ -37,19 +45,61 @@ class SimulatedExecutionHandler:
     rng_seed: int = 7
 
     _tick_index: dict[str, int] = field(default_factory=dict, init=False)
-    _pending: dict[str, deque[_PendingOrder]] = field(default_factory=dict, init=False)
-    _rng: random.Random = field(init=False)
+    _pending: dict[str, list[_PendingOrder]] = field(default_factory=dict, init=False)
+    # Earliest tick at which any pending order for the symbol can fill; lets
+    # on_market skip the queue walk while everything is in its latency window.
+    _min_eligible: dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _rng: np.random.Generator = field(init=False)
+    _uniform_buf: npt.NDArray[np.float64] = field(init=False, repr=False)
+    _uniform_pos: int = field(default=0, init=False, repr=False)
+    # Config-derived constants, folded once so the per-tick/per-fill paths
+    # avoid nested dataclass attribute chains and repeated divisions.
+    _impact_coef: float = field(init=False, repr=False)
+    _default_spread_frac: float = field(init=False, repr=False)
+    _limit_p_fill: float = field(init=False, repr=False)
+    _latency_events: int = field(init=False, repr=False)
+    _max_participation_rate: float = field(init=False, repr=False)
+    _default_tick_volume: float = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
-        self._rng = random.Random(self.rng_seed)
+        self._rng = np.random.default_rng(self.rng_seed)
+        self._uniform_buf = np.empty(0, dtype=np.float64)
+        cfg = self.cfg
+        self._impact_coef = cfg.impact_bps_per_unit / max(cfg.impact_volume, 1.0) / 10_000.0
+        self._default_spread_frac = cfg.default_spread_bps / 10_000.0
+        self._limit_p_fill = cfg.micro.base_fill_probability * (
+            1.0 - cfg.micro.queue_ahead_fraction
+        )
+        self._latency_events = cfg.micro.latency_events
+        self._max_participation_rate = cfg.micro.max_participation_rate
+        self._default_tick_volume = cfg.micro.default_tick_volume
+
+    def _next_uniform(self) -> float:
+        if self._uniform_pos >= self._uniform_buf.shape[0]:
+            self._uniform_buf = self._rng.random(_RNG_BATCH_SIZE)
+            self._uniform_pos = 0
+        value = self._uniform_buf[self._uniform_pos]
+        self._uniform_pos += 1
+        return float(value)
 
     def submit(self, order: OrderEvent) -> None:
         sym = order.symbol
         if sym not in self._pending:
-            self._pending[sym] = deque()
+            self._pending[sym] = []
+        q = self._pending[sym]
         tick = self._tick_index.get(sym, 0)
-        self._pending[sym].append(
-            _PendingOrder(order=order, submitted_tick=tick, remaining=order.quantity)
+        eligible_at = tick + self._latency_events
+        if not q:
+            self._min_eligible[sym] = eligible_at
+        else:
+            self._min_eligible[sym] = min(self._min_eligible[sym], eligible_at)
+        q.append(
+            _PendingOrder(
+                order=order,
+                submitted_tick=tick,
+                remaining=order.quantity,
+                side_sign=1 if order.side is Side.BUY else -1,
+            )
         )
 
     def on_market(self, market: MarketEvent) -> list[FillEvent]:
@@ -62,20 +112,31 @@ class SimulatedExecutionHandler:
         if not q:
             return fills
 
-        eligible_after = self.cfg.micro.latency_events
-        tick_volume = (
-            market.volume if market.volume is not None else self.cfg.micro.default_tick_volume
-        )
-        max_fill_this_tick = int(max(0.0, tick_volume * self.cfg.micro.max_participation_rate))
+        # Fast path: nothing in the queue has cleared its latency window yet.
+        # The watermark only ever lags (orders that stay pending past it make
+        # it conservative), so a stale value never skips an eligible order.
+        if tick < self._min_eligible[sym]:
+            return fills
+
+        eligible_after = self._latency_events
+        tick_volume = market.volume if market.volume is not None else self._default_tick_volume
+        max_fill_this_tick = int(max(0.0, tick_volume * self._max_participation_rate))
 
         remaining_capacity = max_fill_this_tick
 
-        # process in FIFO order
-        for _ in range(len(q)):
-            pending = q[0]
+        # Process in FIFO order with an index cursor; surviving orders are
+        # collected into `carry` and re-queued behind any unvisited ones, the
+        # same order the old deque.rotate(-1) scheme produced but in O(K)
+        # instead of O(K^2) (each rotate shifted the whole deque).
+        carry: list[_PendingOrder] = []
+        i = 0
+        n = len(q)
+        while i < n:
+            pending = q[i]
             if tick - pending.submitted_tick < eligible_after:
-                # not eligible yet; rotate to preserve FIFO among ineligible
-                q.rotate(-1)
+                # not eligible yet; keep waiting, FIFO preserved via carry
+                carry.append(pending)
+                i += 1
                 continue
 
             if remaining_capacity <= 0:
@@ -84,19 +145,18 @@ class SimulatedExecutionHandler:
             # Decide if order can fill (especially for LIMIT)
             if pending.order.order_type == "LIMIT":
                 if pending.order.limit_price is None:
-                    # invalid limit -> skip
-                    q.popleft()
+                    # invalid limit -> drop
+                    i += 1
                     continue
-                if not self._limit_is_touching(pending.order, market):
+                if not self._limit_is_touching(pending.order, market, pending.side_sign):
                     # keep waiting
-                    q.rotate(-1)
+                    carry.append(pending)
+                    i += 1
                     continue
-                # Queue position: reduce fill probability
-                p_fill = self.cfg.micro.base_fill_probability * (
-                    1.0 - self.cfg.micro.queue_ahead_fraction
-                )
-                if self._rng.random() > p_fill:
-                    q.rotate(-1)
+                # Queue position: reduced fill probability, folded once.
+                if self._next_uniform() > self._limit_p_fill:
+                    carry.append(pending)
+                    i += 1
                     continue
 
             # Determine fill quantity (partial fills)
@@ -105,28 +165,35 @@ class SimulatedExecutionHandler:
                 break
 
             commission = 0.0 if pending.commission_charged else self.commission_per_trade
-            fill = self._fill(pending.order, market, fill_qty, commission=commission)
+            fill = self._fill(
+                pending.order,
+                market,
+                fill_qty,
+                commission=commission,
+                side_sign=pending.side_sign,
+            )
             fills.append(fill)
             pending.commission_charged = True
 
             pending.remaining -= fill_qty
             remaining_capacity -= fill_qty
 
-            if pending.remaining <= 0:
-                q.popleft()
-            else:
+            if pending.remaining > 0:
                 # partially filled, move to end (others may get a chance next tick)
-                q.rotate(-1)
+                carry.append(pending)
+            i += 1
 
+        # Unvisited orders (capacity break) stay in front, as before.
+        q[:] = q[i:] + carry
         return fills
 
-    def _limit_is_touching(self, order: OrderEvent, market: MarketEvent) -> bool:
+    def _limit_is_touching(self, order: OrderEvent, market: MarketEvent, side_sign: int) -> bool:
         # BUY limit fills if limit >= ask (or >= mid if no ask)
         # SELL limit fills if limit <= bid (or <= mid if no bid)
         limit = float(order.limit_price) if order.limit_price is not None else None
         if limit is None:
             return False
-        if order.side.value == "BUY":
+        if side_sign > 0:
             ref = market.ask if market.ask is not None else market.mid
             return limit >= ref
         ref = market.bid if market.bid is not None else market.mid
@@ -135,21 +202,18 @@ class SimulatedExecutionHandler:
     def _effective_spread(self, market: MarketEvent) -> float:
         if market.bid is not None and market.ask is not None and market.ask >= market.bid:
             return market.ask - market.bid
-        spread_bps = (
-            market.spread_bps if market.spread_bps is not None else self.cfg.default_spread_bps
-        )
-        return market.mid * (spread_bps / 10_000.0)
+        if market.spread_bps is not None:
+            return market.mid * (market.spread_bps / 10_000.0)
+        return market.mid * self._default_spread_frac
 
     def _fill(
-        self, order: OrderEvent, market: MarketEvent, qty: int, commission: float
+        self, order: OrderEvent, market: MarketEvent, qty: int, commission: float, side_sign: int
     ) -> FillEvent:
         spread = self._effective_spread(market)
         half_spread = 0.5 * spread
 
-        impact_bps = self.cfg.impact_bps_per_unit * (qty / max(self.cfg.impact_volume, 1.0))
-        impact = market.mid * (impact_bps / 10_000.0)
+        impact = market.mid * (qty * self._impact_coef)
 
-        side_sign = 1 if order.side.value == "BUY" else -1
         price = market.mid + side_sign * (half_spread + impact)
         slippage = price - market.mid
 
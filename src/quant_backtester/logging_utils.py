@@ -6,11 +6,31 @@ import logging
 import sys
 from typing import Any
 
+try:  # C serializer for the per-record hot path; stdlib output is identical.
+    import orjson
+except ImportError:  # pragma: no cover - depends on optional install
+    orjson = None  # type: ignore[assignment]
+
 
 class JsonFormatter(logging.Formatter):
+    def __init__(self) -> None:
+        super().__init__()
+        # The date-to-seconds part of the timestamp is cached and reused for
+        # every record within the same second; only the microseconds are
+        # formatted per record. Uses record.created, so no extra clock read.
+        self._ts_sec = -1
+        self._ts_prefix = ""
+
+    def _timestamp(self, created: float) -> str:
+        sec = int(created)
+        if sec != self._ts_sec:
+            self._ts_sec = sec
+            self._ts_prefix = dt.datetime.fromtimestamp(sec, dt.UTC).strftime("%Y-%m-%dT%H:%M:%S")
+        return f"{self._ts_prefix}.{int((created - sec) * 1e6):06d}+00:00"
+
     def format(self, record: logging.LogRecord) -> str:
         payload: dict[str, Any] = {
-            "ts": dt.datetime.now(dt.UTC).isoformat(),
+            "ts": self._timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "msg": record.getMessage(),
@@ -18,6 +38,8 @@ class JsonFormatter(logging.Formatter):
         event = getattr(record, "event", None)
         if isinstance(event, dict):
             payload.update(event)
+        if orjson is not None:
+            return orjson.dumps(payload, default=str).decode()
         return json.dumps(payload, default=str)
 
 
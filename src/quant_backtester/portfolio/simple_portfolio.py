@@ -2,6 +2,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+import numpy as np
+import numpy.typing as npt
+
 from quant_backtester.config import RiskConfig
 from quant_backtester.events import FillEvent, Side
 
@@ -12,7 +15,7 @@ class Position:
     avg_cost: float = 0.0  # average entry cost per share
 
     def update_on_fill(self, fill: FillEvent) -> None:
-        signed_qty = fill.quantity if fill.side == Side.BUY else -fill.quantity
+        signed_qty = fill.side.sign * fill.quantity
         new_qty = self.quantity + signed_qty
 
         # If position flips sign or goes to zero, reset avg cost on the remainder.
@@ -54,12 +57,23 @@ class RiskState:
 class MultiAssetPortfolio:
     initial_cash: float
     risk_cfg: RiskConfig
+    # Expected number of mark_to_market calls; lets the equity buffer be
+    # sized exactly up front instead of growing by doubling.
+    expected_marks: int | None = None
 
     cash: float = field(init=False)
     positions: dict[str, Position] = field(default_factory=dict, init=False)
     last_mid: dict[str, float] = field(default_factory=dict, init=False)
-    equity_curve: list[float] = field(default_factory=list, init=False)
+    # Equity curve lives in a preallocated float64 buffer (doubled on overflow)
+    # so metrics run as single C-level passes over contiguous memory.
+    _equity_buf: npt.NDArray[np.float64] = field(
+        default_factory=lambda: np.empty(1024, dtype=np.float64), init=False, repr=False
+    )
+    _equity_len: int = field(default=0, init=False, repr=False)
     peak_equity: float = field(default=0.0, init=False)
+    # Running max drawdown, updated alongside the halt check so callers do
+    # not need a post-hoc pass over the equity curve.
+    max_dd: float = field(default=0.0, init=False)
     _equity: float = field(default=0.0, init=False)
     risk_state: RiskState = field(default_factory=RiskState, init=False)
 
@@ -67,10 +81,20 @@ class MultiAssetPortfolio:
     total_commission: float = field(default=0.0, init=False)
     total_slippage_cost: float = field(default=0.0, init=False)  # absolute cost vs mid
 
+    # Symbols with a nonzero position, so stop-loss checks skip flat symbols.
+    _open_symbols: set[str] = field(default_factory=set, init=False, repr=False)
+    _stop_long_factor: float = field(init=False, repr=False)
+    _stop_short_factor: float = field(init=False, repr=False)
+
     def __post_init__(self) -> None:
+        if self.expected_marks is not None and self.expected_marks > self._equity_buf.shape[0]:
+            self._equity_buf = np.empty(self.expected_marks, dtype=np.float64)
         self.cash = float(self.initial_cash)
         self.peak_equity = self.initial_cash
         self._equity = self.initial_cash
+        # Fold the stop-loss percentage into threshold multipliers once.
+        self._stop_long_factor = 1.0 - self.risk_cfg.stop_loss_pct
+        self._stop_short_factor = 1.0 + self.risk_cfg.stop_loss_pct
 
     def get_position(self, symbol: str) -> Position:
         if symbol not in self.positions:
@@ -79,14 +103,14 @@ class MultiAssetPortfolio:
 
     def can_place_order(self, symbol: str, side: Side, qty: int) -> bool:
         pos = self.get_position(symbol)
-        signed = qty if side == Side.BUY else -qty
+        signed = side.sign * qty
         proposed = pos.quantity + signed
         return abs(proposed) <= self.risk_cfg.max_position_per_symbol
 
     def on_fill(self, fill: FillEvent) -> None:
         pos = self.get_position(fill.symbol)
         old_qty = pos.quantity
-        signed_qty = fill.quantity if fill.side == Side.BUY else -fill.quantity
+        signed_qty = fill.side.sign * fill.quantity
 
         # cash movement: BUY decreases cash, SELL increases cash
         cash_delta = -(fill.fill_price * signed_qty) - fill.commission
@@ -98,6 +122,10 @@ class MultiAssetPortfolio:
         self.total_slippage_cost += fill.slippage * signed_qty  # signed_qty carries side
 
         pos.update_on_fill(fill)
+        if pos.quantity != 0:
+            self._open_symbols.add(fill.symbol)
+        else:
+            self._open_symbols.discard(fill.symbol)
 
         # Keep equity updated in O(1) when mid price is available.
         mid = self.last_mid.get(fill.symbol)
@@ -119,18 +147,27 @@ class MultiAssetPortfolio:
             self._equity += qty * (mid - prev_mid)
 
         equity = self._equity
-        self.equity_curve.append(equity)
+        if self._equity_len == self._equity_buf.shape[0]:
+            self._equity_buf = np.concatenate([self._equity_buf, np.empty_like(self._equity_buf)])
+        self._equity_buf[self._equity_len] = equity
+        self._equity_len += 1
         self.peak_equity = max(self.peak_equity, equity)
 
-        # max drawdown halt
+        # max drawdown halt (dd doubles as the running max-drawdown metric)
         if self.peak_equity > 0:
             dd = (self.peak_equity - equity) / self.peak_equity
+            if dd > self.max_dd:
+                self.max_dd = dd
             if dd >= self.risk_cfg.max_drawdown_pct and not self.risk_state.trading_halted:
                 self.risk_state.trading_halted = True
                 self.risk_state.halt_reason = f"Max drawdown reached: {dd:.2%}"
 
         return equity
 
+    @property
+    def equity_curve(self) -> npt.NDArray[np.float64]:
+        return self._equity_buf[: self._equity_len]
+
     def equity(self) -> float:
         return float(self._equity)
 
@@ -144,17 +181,18 @@ class MultiAssetPortfolio:
         return float(total)
 
     def check_stop_loss(self, symbol: str) -> Side | None:
-        pos = self.positions.get(symbol)
-        if pos is None or pos.quantity == 0:
+        # Fast path: most ticks arrive for symbols with no open position.
+        if symbol not in self._open_symbols:
             return None
+        pos = self.positions[symbol]
         mid = self.last_mid.get(symbol)
         if mid is None or pos.avg_cost == 0:
             return None
 
         # If long: stop if mid <= avg_cost*(1-stop_loss_pct)
         # If short: stop if mid >= avg_cost*(1+stop_loss_pct)
-        if pos.quantity > 0 and mid <= pos.avg_cost * (1.0 - self.risk_cfg.stop_loss_pct):
+        if pos.quantity > 0 and mid <= pos.avg_cost * self._stop_long_factor:
             return Side.SELL
-        if pos.quantity < 0 and mid >= pos.avg_cost * (1.0 + self.risk_cfg.stop_loss_pct):
+        if pos.quantity < 0 and mid >= pos.avg_cost * self._stop_short_factor:
             return Side.BUY
         return None
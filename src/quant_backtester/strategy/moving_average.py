@@ -1,11 +1,45 @@
 from __future__ import annotations
 
+import sys
 from collections import deque
 from dataclasses import dataclass
 
+import numpy as np
+import numpy.typing as npt
+
 from quant_backtester.events import MarketEvent, Side, SignalEvent
 
 
+class _SymbolState:
+    """Per-symbol rolling-window state, kept in one slotted object so the hot
+    path does a single dict lookup per tick instead of one per field.
+
+    The running sums carry a Kahan compensation term: the incremental
+    subtract-oldest/add-newest update otherwise accumulates rounding error
+    over millions of ticks, and the windows are never recomputed from
+    scratch.
+    """
+
+    __slots__ = (
+        "long_prices",
+        "short_prices",
+        "long_sum",
+        "short_sum",
+        "long_comp",
+        "short_comp",
+        "last_signal",
+    )
+
+    def __init__(self, short_window: int, long_window: int) -> None:
+        self.long_prices: deque[float] = deque(maxlen=long_window)
+        self.short_prices: deque[float] = deque(maxlen=short_window)
+        self.long_sum = 0.0
+        self.short_sum = 0.0
+        self.long_comp = 0.0
+        self.short_comp = 0.0
+        self.last_signal: Side | None = None
+
+
 @dataclass
 class MovingAverageCrossStrategy:
     symbols: tuple[str, ...]
@@ -18,52 +52,92 @@ class MovingAverageCrossStrategy:
         if self.short_window >= self.long_window:
             raise ValueError("short_window must be < long_window")
 
-        self._long_prices: dict[str, deque[float]] = {
-            s: deque(maxlen=self.long_window) for s in self.symbols
-        }
-        self._short_prices: dict[str, deque[float]] = {
-            s: deque(maxlen=self.short_window) for s in self.symbols
+        # Interned keys pair with the data handler's interned labels so the
+        # per-tick lookup compares by identity.
+        self._state: dict[str, _SymbolState] = {
+            sys.intern(s): _SymbolState(self.short_window, self.long_window) for s in self.symbols
         }
-        self._long_sums: dict[str, float] = {s: 0.0 for s in self.symbols}
-        self._short_sums: dict[str, float] = {s: 0.0 for s in self.symbols}
-        self._last_signal: dict[str, Side | None] = {s: None for s in self.symbols}
+
+    def precompute_signals(
+        self,
+        symbol: str,
+        mid: npt.NDArray[np.float64],
+        timestamps: npt.NDArray[np.datetime64],
+    ) -> list[SignalEvent]:
+        """Batch equivalent of streaming one symbol's ticks through on_market.
+
+        Rolling means come from one cumsum pass and crossings from a sign
+        diff, so the per-tick Python loop disappears; only the (rare) emitted
+        SignalEvents are materialized. Intended for research and sweep-style
+        consumers that hold the full mid column; the event loop keeps using
+        on_market because execution feedback is path-dependent.
+        """
+        n = int(mid.shape[0])
+        if n < self.long_window:
+            return []
+
+        csum = np.concatenate(([0.0], np.cumsum(mid)))
+        short_ma = (csum[self.short_window :] - csum[: -self.short_window]) / self.short_window
+        long_ma = (csum[self.long_window :] - csum[: -self.long_window]) / self.long_window
+
+        # Align the short MA to ticks where the long window is also full.
+        offset = self.long_window - self.short_window
+        sign = np.sign(short_ma[offset:] - long_ma).astype(np.int8)
+
+        # last_signal dedup: emit only where the (nonzero) sign differs from
+        # the previous nonzero sign; ties leave the state untouched.
+        nonzero = np.flatnonzero(sign)
+        if nonzero.size == 0:
+            return []
+        values = sign[nonzero]
+        emit = np.empty(nonzero.size, dtype=np.bool_)
+        emit[0] = True
+        emit[1:] = values[1:] != values[:-1]
+
+        rows = nonzero[emit] + self.long_window - 1
+        emitted_ts = timestamps[rows].astype("datetime64[us]").tolist()
+        return [
+            SignalEvent(timestamp=ts, symbol=symbol, side=Side.BUY if v > 0 else Side.SELL)
+            for ts, v in zip(emitted_ts, values[emit].tolist(), strict=True)
+        ]
 
     def on_market(self, event: MarketEvent) -> SignalEvent | None:
-        if event.symbol not in self._long_prices:
+        state = self._state.get(event.symbol)
+        if state is None:
             return None
 
-        symbol = event.symbol
         px = event.mid
 
-        long_q = self._long_prices[symbol]
-        long_sum = self._long_sums[symbol]
-        if len(long_q) == self.long_window:
-            long_sum -= long_q[0]
+        long_q = state.long_prices
+        delta = px if len(long_q) < self.long_window else px - long_q[0]
         long_q.append(px)
-        long_sum += px
-        self._long_sums[symbol] = long_sum
+        # Kahan update: fold the compensation into the increment, then
+        # recapture the low-order bits lost by the add.
+        y = delta - state.long_comp
+        total = state.long_sum + y
+        state.long_comp = (total - state.long_sum) - y
+        state.long_sum = total
 
-        short_q = self._short_prices[symbol]
-        short_sum = self._short_sums[symbol]
-        if len(short_q) == self.short_window:
-            short_sum -= short_q[0]
+        short_q = state.short_prices
+        delta = px if len(short_q) < self.short_window else px - short_q[0]
         short_q.append(px)
-        short_sum += px
-        self._short_sums[symbol] = short_sum
+        y = delta - state.short_comp
+        total = state.short_sum + y
+        state.short_comp = (total - state.short_sum) - y
+        state.short_sum = total
 
         if len(long_q) < self.long_window:
             return None
 
-        short_ma = short_sum / self.short_window
-        long_ma = long_sum / self.long_window
+        short_ma = state.short_sum / self.short_window
+        long_ma = state.long_sum / self.long_window
 
-        last = self._last_signal[symbol]
-        if short_ma > long_ma and last != Side.BUY:
-            self._last_signal[symbol] = Side.BUY
-            return SignalEvent(timestamp=event.timestamp, symbol=symbol, side=Side.BUY)
+        if short_ma > long_ma and state.last_signal != Side.BUY:
+            state.last_signal = Side.BUY
+            return SignalEvent(timestamp=event.timestamp, symbol=event.symbol, side=Side.BUY)
 
-        if short_ma < long_ma and last != Side.SELL:
-            self._last_signal[symbol] = Side.SELL
-            return SignalEvent(timestamp=event.timestamp, symbol=symbol, side=Side.SELL)
+        if short_ma < long_ma and state.last_signal != Side.SELL:
+            state.last_signal = Side.SELL
+            return SignalEvent(timestamp=event.timestamp, symbol=event.symbol, side=Side.SELL)
 
         return None
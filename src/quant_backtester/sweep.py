@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import logging
+import os
 from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import replace
 from itertools import product
 from pathlib import Path
@@ -11,20 +14,66 @@ import pandas as pd
 
 from quant_backtester.backtest import run_backtest, run_to_model
 from quant_backtester.config import BacktestConfig
+from quant_backtester.data.csv_data_handler import CSVDataHandler, MarketColumns
 from quant_backtester.persistence.db import Database
 
 logger = logging.getLogger(__name__)
 
+# Per-process cache of the last parsed input, keyed by (path, universe). Grid
+# points share one file, so each worker (and the serial parent) parses and
+# validates it once instead of once per backtest; only the latest table is
+# kept resident.
+_columns_cache: dict[tuple[str, frozenset[str]], MarketColumns] = {}
+
+
+def _cached_columns(csv_path: str, symbol_set: frozenset[str]) -> MarketColumns:
+    key = (csv_path, symbol_set)
+    cols = _columns_cache.get(key)
+    if cols is None:
+        _columns_cache.clear()
+        cols = CSVDataHandler(csv_path).columns(symbol_set)
+        _columns_cache[key] = cols
+    return cols
+
 
 def _valid_param_pairs(short_windows: list[int], long_windows: list[int]) -> list[tuple[int, int]]:
     return [(sw, lw) for sw, lw in product(short_windows, long_windows) if sw < lw]
 
 
+def _run_single_backtest(run_cfg: BacktestConfig) -> dict[str, object]:
+    """Module-level worker so it pickles cleanly into spawned processes."""
+    cols = _cached_columns(run_cfg.csv_path, run_cfg.symbol_set)
+    return run_backtest(run_cfg, persist=False, market_columns=cols)
+
+
+def _map_backtests(run_cfgs: list[BacktestConfig], n_jobs: int) -> Iterator[dict[str, object]]:
+    """Run backtests serially or across worker processes, preserving order.
+
+    Grid points are independent (persist=False), so the sweep is
+    embarrassingly parallel; persistence stays in the parent to keep a
+    single SQLite writer.
+    """
+    if n_jobs == 1 or len(run_cfgs) <= 1:
+        return map(_run_single_backtest, run_cfgs)
+    max_workers = os.cpu_count() or 1 if n_jobs < 0 else n_jobs
+    executor = ProcessPoolExecutor(max_workers=max_workers)
+    # Ship several grid points per task so submission/result IPC is amortized,
+    # while keeping ~4 chunks per worker for load balancing.
+    chunksize = max(1, len(run_cfgs) // (max_workers * 4))
+
+    def _results() -> Iterator[dict[str, object]]:
+        with executor:
+            yield from executor.map(_run_single_backtest, run_cfgs, chunksize=chunksize)
+
+    return _results()
+
+
 def run_parameter_sweep(
     cfg: BacktestConfig,
     short_windows: list[int],
     long_windows: list[int],
     export_csv: str | None = None,
+    n_jobs: int = 1,
 ) -> pd.DataFrame:
     if export_csv is None:
         export_csv = str(Path(cfg.out_dir) / "sweep_results.csv")
@@ -39,27 +88,9 @@ def run_parameter_sweep(
             }
         },
     )
-    results: list[dict[str, object]] = []
     valid_pairs = _valid_param_pairs(short_windows, long_windows)
-    db = Database(cfg.database_url)
-    db.create_tables()
-    pending_models = []
-    insert_chunk_size = 500
-    for sw, lw in valid_pairs:
-        run_cfg = replace(
-            cfg, short_window=sw, long_window=lw, run_name=f"{cfg.run_name}-sw{sw}-lw{lw}"
-        )
-        run_result = run_backtest(run_cfg, persist=False)
-        results.append(run_result)
-        pending_models.append(run_to_model(run_result))
-        if len(pending_models) >= insert_chunk_size:
-            db.insert_runs_bulk(pending_models)
-            pending_models.clear()
-
-    if pending_models:
-        db.insert_runs_bulk(pending_models)
-
-    if not results:
+    if not valid_pairs:
+        # Bail before touching the database: no configs, no engine, no schema.
         logger.warning(
             "Sweep has no valid parameter pairs",
             extra={
@@ -93,9 +124,30 @@ def run_parameter_sweep(
         df.to_csv(export_csv, index=False)
         return df
 
+    results: list[dict[str, object]] = []
+    db = Database(cfg.database_url)
+    db.create_tables()
+    pending_models = []
+    insert_chunk_size = 500
+    run_cfgs = [
+        cfg.with_windows(sw, lw, run_name=f"{cfg.run_name}-sw{sw}-lw{lw}") for sw, lw in valid_pairs
+    ]
+    for run_result in _map_backtests(run_cfgs, n_jobs):
+        results.append(run_result)
+        pending_models.append(run_to_model(run_result))
+        if len(pending_models) >= insert_chunk_size:
+            db.insert_runs_bulk(pending_models)
+            pending_models.clear()
+
+    if pending_models:
+        db.insert_runs_bulk(pending_models)
+
     df = pd.DataFrame(results)
     df = df.sort_values(["total_return", "sharpe"], ascending=False)
     Path(export_csv).parent.mkdir(parents=True, exist_ok=True)
+    # Deliberately pandas, not pyarrow.csv: the summary has one row per grid
+    # point, so write time is noise next to the backtests, and Arrow's writer
+    # renders bools/nested columns (halted, symbols, extra) differently.
     df.to_csv(export_csv, index=False)
     logger.info(
         "Sweep completed",
@@ -181,15 +233,14 @@ def run_walk_forward(
             best_train_result: dict[str, object] | None = None
             best_pair: tuple[int, int] | None = None
 
+            train_base_cfg = replace(cfg, csv_path=str(train_csv))
+            # Parse the window once; every grid point replays the same columns.
+            train_cols = CSVDataHandler(str(train_csv)).columns(train_base_cfg.symbol_set)
             for sw, lw in valid_pairs:
-                train_cfg = replace(
-                    cfg,
-                    csv_path=str(train_csv),
-                    short_window=sw,
-                    long_window=lw,
-                    run_name=f"{cfg.run_name}-wf{window_idx}-train-sw{sw}-lw{lw}",
+                train_cfg = train_base_cfg.with_windows(
+                    sw, lw, run_name=f"{cfg.run_name}-wf{window_idx}-train-sw{sw}-lw{lw}"
                 )
-                train_result = run_backtest(train_cfg, persist=False)
+                train_result = run_backtest(train_cfg, persist=False, market_columns=train_cols)
                 train_score = (
                     float(train_result["total_return"]),
                     float(train_result["sharpe"]),
@@ -219,7 +270,9 @@ def run_walk_forward(
                 run_name=f"{cfg.run_name}-wf{window_idx}-oos-sw{best_pair[0]}-lw{best_pair[1]}",
             )
             oos_result = run_backtest(test_cfg, persist=False)
-            oos_extra = dict(oos_result["extra"]) if isinstance(oos_result.get("extra"), dict) else {}
+            oos_extra = (
+                dict(oos_result["extra"]) if isinstance(oos_result.get("extra"), dict) else {}
+            )
             oos_extra["walk_forward"] = {
                 "window_index": window_idx,
                 "train_start": train_dates[0].isoformat(),
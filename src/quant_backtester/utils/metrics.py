@@ -1,17 +1,17 @@
 from __future__ import annotations
 
 import math
-from typing import cast
 
 import numpy as np
 import numpy.typing as npt
 
 
-def returns_from_equity(equity: list[float]) -> npt.NDArray[np.float64]:
-    if len(equity) < 2:
+def returns_from_equity(equity: npt.ArrayLike) -> npt.NDArray[np.float64]:
+    eq = np.asarray(equity, dtype=np.float64)
+    if eq.size < 2:
         return np.array([], dtype=np.float64)
-    eq = np.array(equity, dtype=float)
-    return cast(npt.NDArray[np.float64], (np.diff(eq) / eq[:-1]).astype(np.float64))
+    # np.diff on a float64 input is already float64; no extra cast pass.
+    return np.diff(eq) / eq[:-1]
 
 
 def sharpe_ratio(daily_returns: npt.NDArray[np.float64], trading_days: int = 252) -> float:
@@ -24,13 +24,13 @@ def sharpe_ratio(daily_returns: npt.NDArray[np.float64], trading_days: int = 252
     return (mu / sigma) * math.sqrt(trading_days)
 
 
-def max_drawdown(equity: list[float]) -> float:
-    if not equity:
+def max_drawdown(equity: npt.ArrayLike) -> float:
+    eq = np.asarray(equity, dtype=np.float64)
+    if eq.size == 0:
         return 0.0
-    peak = equity[0]
-    mdd = 0.0
-    for x in equity:
-        peak = max(peak, x)
-        dd = (peak - x) / peak if peak != 0 else 0.0
-        mdd = max(mdd, dd)
-    return mdd
+    peaks = np.maximum.accumulate(eq)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dd = np.where(peaks != 0.0, (peaks - eq) / peaks, 0.0)
+    # Drawdown is floored at 0, matching the old running-max formulation
+    # (an all-negative curve has peak < 0 and would yield dd < 0).
+    return float(max(float(np.max(dd)), 0.0))
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import shutil
+import sqlite3
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from quant_backtester.backtest import run_backtest
+from quant_backtester.config import BacktestConfig
+from quant_backtester.data.csv_data_handler import CSVDataHandler, MarketColumns
+from quant_backtester.persistence.db import Database
+
+SAMPLE_CSV = "data/sample_prices.csv"
+SAMPLE_SYMBOLS = frozenset({"AAPL", "MSFT"})
+
+
+@pytest.fixture(scope="session")
+def sample_market_columns() -> MarketColumns:
+    """Sample data parsed and validated once for the whole suite.
+
+    Tests that run backtests over data/sample_prices.csv with the AAPL/MSFT
+    universe should pass this to run_backtest(market_columns=...) instead of
+    re-parsing the CSV per test.
+    """
+    return CSVDataHandler(SAMPLE_CSV).columns(SAMPLE_SYMBOLS)
+
+
+@pytest.fixture(scope="session")
+def template_runs_db(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """SQLite file with the schema already created, copied per test."""
+    path = tmp_path_factory.mktemp("db_template") / "template.db"
+    db = Database(f"sqlite:///{path}")
+    db.create_tables()
+    db.engine().dispose()
+    return path
+
+
+@pytest.fixture(scope="session")
+def smoke_backtest(
+    sample_market_columns: MarketColumns,
+    template_runs_db: Path,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> tuple[dict[str, object], Path]:
+    """One canonical persisted backtest, run once per session.
+
+    Returns (result dict, db path). Tests using this must treat both as
+    read-only; anything that mutates the database should copy the file.
+    """
+    out_dir = tmp_path_factory.mktemp("smoke_backtest")
+    db_path = out_dir / "runs.db"
+    shutil.copyfile(template_runs_db, db_path)
+    cfg = BacktestConfig(
+        symbols=("AAPL", "MSFT"),
+        csv_path=SAMPLE_CSV,
+        database_url=f"sqlite:///{db_path}",
+        out_dir=str(out_dir / "runs"),
+        run_name="test",
+        short_window=5,
+        long_window=10,
+    )
+    db = Database(cfg.database_url)
+    result = run_backtest(cfg, persist=True, db=db, market_columns=sample_market_columns)
+    db.engine().dispose()
+    return result, db_path
+
+
+@pytest.fixture(scope="session")
+def smoke_db_conn(smoke_backtest: tuple[dict[str, object], Path]) -> Iterator[sqlite3.Connection]:
+    """Read-only connection to the smoke backtest's database, opened once.
+
+    query_only makes accidental writes through this handle a hard error, so
+    the session-scoped database stays safe to share between tests.
+    """
+    _, db_path = smoke_backtest
+    con = sqlite3.connect(f"file:{db_path}?mode=ro&cache=shared", uri=True)
+    con.execute("PRAGMA query_only=ON")
+    yield con
+    con.close()
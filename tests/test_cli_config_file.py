@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 import json
-import subprocess
+import runpy
 import sys
 from pathlib import Path
 
+import pytest
 
-def test_cli_run_dry_run_with_json_config(tmp_path: Path) -> None:
+from quant_backtester.cli import main
+
+
+def test_cli_run_dry_run_with_json_config(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
     cfg = {
         "symbols": ["AAPL", "MSFT"],
         "csv_path": "data/sample_prices.csv",
@@ -20,26 +24,20 @@ def test_cli_run_dry_run_with_json_config(tmp_path: Path) -> None:
     p = tmp_path / "config.json"
     p.write_text(json.dumps(cfg), encoding="utf-8")
 
-    proc = subprocess.run(
-        [sys.executable, "-m", "quant_backtester.cli", "run", "--config", str(p), "--dry-run"],
-        check=False,
-        capture_output=True,
-        text=True,
-    )
-    assert proc.returncode == 0
-    assert "Config valid." in proc.stdout
-    payload = json.loads("\n".join(proc.stdout.splitlines()[1:]))
+    main(["run", "--config", str(p), "--dry-run"])
+    out = capsys.readouterr().out
+    assert "Config valid." in out
+    payload = json.loads("\n".join(out.splitlines()[1:]))
     assert payload["run_name"] == "cfg-run"
     assert payload["symbols"] == ["AAPL", "MSFT"]
 
 
-def test_cli_run_no_persist_does_not_create_rows(tmp_path: Path) -> None:
+def test_cli_run_no_persist_does_not_create_rows(
+    tmp_path: Path, capsys: pytest.CaptureFixture
+) -> None:
     db_path = tmp_path / "runs.db"
-    proc = subprocess.run(
+    main(
         [
-            sys.executable,
-            "-m",
-            "quant_backtester.cli",
             "run",
             "--csv",
             "data/sample_prices.csv",
@@ -54,21 +52,17 @@ def test_cli_run_no_persist_does_not_create_rows(tmp_path: Path) -> None:
             "--out",
             str(tmp_path / "runs"),
             "--no-persist",
-        ],
-        check=False,
-        capture_output=True,
-        text=True,
+        ]
     )
-    assert proc.returncode == 0
+    capsys.readouterr()
     assert not db_path.exists()
 
 
-def test_cli_run_dry_run_reports_persist_false(tmp_path: Path) -> None:
-    proc = subprocess.run(
+def test_cli_run_dry_run_reports_persist_false(
+    tmp_path: Path, capsys: pytest.CaptureFixture
+) -> None:
+    main(
         [
-            sys.executable,
-            "-m",
-            "quant_backtester.cli",
             "run",
             "--csv",
             "data/sample_prices.csv",
@@ -84,17 +78,53 @@ def test_cli_run_dry_run_reports_persist_false(tmp_path: Path) -> None:
             str(tmp_path / "runs"),
             "--no-persist",
             "--dry-run",
-        ],
-        check=False,
-        capture_output=True,
-        text=True,
+        ]
     )
-    assert proc.returncode == 0
-    payload = json.loads("\n".join(proc.stdout.splitlines()[1:]))
+    out = capsys.readouterr().out
+    payload = json.loads("\n".join(out.splitlines()[1:]))
     assert payload["persist"] is False
 
 
-def test_cli_walk_forward_dry_run_with_config(tmp_path: Path) -> None:
+@pytest.mark.filterwarnings("ignore:.*found in sys.modules.*:RuntimeWarning")
+def test_cli_module_entrypoint_via_runpy(
+    tmp_path: Path, capsys: pytest.CaptureFixture, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Exercise the `python -m quant_backtester.cli` __main__ path without a
+    subprocess: runpy re-executes the module under a patched argv."""
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "quant_backtester",
+            "run",
+            "--csv",
+            "data/sample_prices.csv",
+            "--symbols",
+            "AAPL,MSFT",
+            "--short",
+            "5",
+            "--long",
+            "10",
+            "--out",
+            str(tmp_path / "runs"),
+            "--no-persist",
+            "--dry-run",
+        ],
+    )
+    runpy.run_module("quant_backtester.cli", run_name="__main__")
+    out = capsys.readouterr().out
+    assert "Config valid." in out
+
+    # Argument errors must still exit with argparse's status code 2.
+    monkeypatch.setattr(sys, "argv", ["quant_backtester", "run", "--csv", "x.csv"])
+    with pytest.raises(SystemExit) as exc:
+        runpy.run_module("quant_backtester.cli", run_name="__main__")
+    assert exc.value.code == 2
+
+
+def test_cli_walk_forward_dry_run_with_config(
+    tmp_path: Path, capsys: pytest.CaptureFixture
+) -> None:
     cfg = {
         "symbols": ["AAPL", "MSFT"],
         "csv_path": "data/sample_prices.csv",
@@ -108,22 +138,9 @@ def test_cli_walk_forward_dry_run_with_config(tmp_path: Path) -> None:
     p = tmp_path / "config.json"
     p.write_text(json.dumps(cfg), encoding="utf-8")
 
-    proc = subprocess.run(
-        [
-            sys.executable,
-            "-m",
-            "quant_backtester.cli",
-            "walk-forward",
-            "--config",
-            str(p),
-            "--dry-run",
-        ],
-        check=False,
-        capture_output=True,
-        text=True,
-    )
-    assert proc.returncode == 0
-    payload = json.loads("\n".join(proc.stdout.splitlines()[1:]))
+    main(["walk-forward", "--config", str(p), "--dry-run"])
+    out = capsys.readouterr().out
+    payload = json.loads("\n".join(out.splitlines()[1:]))
     assert payload["cmd"] == "walk-forward"
     assert payload["train_days"] == 30
     assert payload["test_days"] == 15
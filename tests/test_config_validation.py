@@ -24,3 +24,15 @@ def test_backtest_config_requires_valid_windows_and_symbols() -> None:
         BacktestConfig(symbols=(), short_window=5, long_window=10)
     with pytest.raises(ValueError):
         BacktestConfig(symbols=("AAPL",), short_window=10, long_window=10)
+
+
+def test_with_windows_copies_fields_and_validates_windows() -> None:
+    cfg = BacktestConfig(symbols=("AAPL",), short_window=5, long_window=10, run_name="base")
+    derived = cfg.with_windows(7, 21, run_name="base-sw7-lw21")
+    assert derived.short_window == 7
+    assert derived.long_window == 21
+    assert derived.run_name == "base-sw7-lw21"
+    assert derived.symbols == cfg.symbols
+    assert derived.execution is cfg.execution
+    with pytest.raises(ValueError):
+        cfg.with_windows(21, 7)
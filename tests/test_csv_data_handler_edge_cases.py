@@ -2,27 +2,28 @@ from __future__ import annotations
 
 from pathlib import Path
 
-import pandas as pd
 import pytest
 
 from quant_backtester.data.csv_data_handler import CSVDataHandler
 
+# One-row fixtures are written as literal CSV text; building a pandas
+# DataFrame just to serialise a single row costs far more than the parse
+# under test.
+
 
 def test_csv_missing_required_columns(tmp_path: Path) -> None:
     p = tmp_path / "bad.csv"
-    pd.DataFrame({"date": ["2020-01-01"], "symbol": ["AAPL"]}).to_csv(p, index=False)
+    p.write_text("date,symbol\n2020-01-01,AAPL\n", encoding="utf-8")
     with pytest.raises(ValueError, match="CSV missing columns"):
         list(CSVDataHandler(str(p)).stream())
 
 
 def test_csv_optional_columns_with_nulls(tmp_path: Path) -> None:
     p = tmp_path / "ok.csv"
-    pd.DataFrame(
-        [
-            {"date": "2020-01-01", "symbol": "AAPL", "mid": 100.0, "bid": None, "ask": None},
-            {"date": "2020-01-02", "symbol": "AAPL", "mid": 101.0, "spread_bps": None},
-        ]
-    ).to_csv(p, index=False)
+    p.write_text(
+        "date,symbol,mid,bid,ask,spread_bps\n2020-01-01,AAPL,100.0,,,\n2020-01-02,AAPL,101.0,,,\n",
+        encoding="utf-8",
+    )
     events = list(CSVDataHandler(str(p)).stream())
     assert len(events) == 2
     assert events[0].bid is None
@@ -31,31 +32,27 @@ def test_csv_optional_columns_with_nulls(tmp_path: Path) -> None:
 
 def test_csv_rejects_non_positive_mid(tmp_path: Path) -> None:
     p = tmp_path / "bad_mid.csv"
-    pd.DataFrame([{"date": "2020-01-01", "symbol": "AAPL", "mid": 0.0}]).to_csv(p, index=False)
+    p.write_text("date,symbol,mid\n2020-01-01,AAPL,0.0\n", encoding="utf-8")
     with pytest.raises(ValueError, match="Invalid mid"):
         list(CSVDataHandler(str(p)).stream())
 
 
 def test_csv_rejects_negative_volume(tmp_path: Path) -> None:
     p = tmp_path / "bad_volume.csv"
-    pd.DataFrame([{"date": "2020-01-01", "symbol": "AAPL", "mid": 100.0, "volume": -1.0}]).to_csv(
-        p, index=False
-    )
+    p.write_text("date,symbol,mid,volume\n2020-01-01,AAPL,100.0,-1.0\n", encoding="utf-8")
     with pytest.raises(ValueError, match="Invalid volume"):
         list(CSVDataHandler(str(p)).stream())
 
 
 def test_csv_rejects_crossed_quotes(tmp_path: Path) -> None:
     p = tmp_path / "bad_quote.csv"
-    pd.DataFrame(
-        [{"date": "2020-01-01", "symbol": "AAPL", "mid": 100.0, "bid": 101.0, "ask": 100.0}]
-    ).to_csv(p, index=False)
+    p.write_text("date,symbol,mid,bid,ask\n2020-01-01,AAPL,100.0,101.0,100.0\n", encoding="utf-8")
     with pytest.raises(ValueError, match="ask .* >= bid"):
         list(CSVDataHandler(str(p)).stream())
 
 
 def test_csv_rejects_invalid_date(tmp_path: Path) -> None:
     p = tmp_path / "bad_date.csv"
-    pd.DataFrame([{"date": "not-a-date", "symbol": "AAPL", "mid": 100.0}]).to_csv(p, index=False)
+    p.write_text("date,symbol,mid\nnot-a-date,AAPL,100.0\n", encoding="utf-8")
     with pytest.raises(ValueError, match="Invalid date"):
         list(CSVDataHandler(str(p)).stream())
@@ -6,6 +6,8 @@ from quant_backtester.config import ExecutionConfig, MicrostructureConfig
 from quant_backtester.events import MarketEvent, OrderEvent, Side
 from quant_backtester.execution.simulated_execution import SimulatedExecutionHandler
 
+_TS = datetime(2020, 1, 1)
+
 
 def test_market_order_partially_fills_across_ticks() -> None:
     cfg = ExecutionConfig(
@@ -18,9 +20,8 @@ def test_market_order_partially_fills_across_ticks() -> None:
         )
     )
     ex = SimulatedExecutionHandler(commission_per_trade=0.0, cfg=cfg, rng_seed=1)
-    ts = datetime(2020, 1, 1)
-    mkt = MarketEvent(timestamp=ts, symbol="AAPL", mid=100.0, spread_bps=0.0, volume=100.0)
-    ex.submit(OrderEvent(timestamp=ts, symbol="AAPL", side=Side.BUY, quantity=120))
+    mkt = MarketEvent(timestamp=_TS, symbol="AAPL", mid=100.0, spread_bps=0.0, volume=100.0)
+    ex.submit(OrderEvent(timestamp=_TS, symbol="AAPL", side=Side.BUY, quantity=120))
 
     fills1 = ex.on_market(mkt)
     fills2 = ex.on_market(mkt)
@@ -41,9 +42,8 @@ def test_commission_charged_once_for_partially_filled_order() -> None:
         )
     )
     ex = SimulatedExecutionHandler(commission_per_trade=2.5, cfg=cfg, rng_seed=1)
-    ts = datetime(2020, 1, 1)
-    mkt = MarketEvent(timestamp=ts, symbol="AAPL", mid=100.0, spread_bps=0.0, volume=100.0)
-    ex.submit(OrderEvent(timestamp=ts, symbol="AAPL", side=Side.BUY, quantity=120))
+    mkt = MarketEvent(timestamp=_TS, symbol="AAPL", mid=100.0, spread_bps=0.0, volume=100.0)
+    ex.submit(OrderEvent(timestamp=_TS, symbol="AAPL", side=Side.BUY, quantity=120))
 
     fills = [*ex.on_market(mkt), *ex.on_market(mkt), *ex.on_market(mkt)]
 
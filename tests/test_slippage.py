@@ -4,6 +4,8 @@ from quant_backtester.config import ExecutionConfig, MicrostructureConfig
 from quant_backtester.events import MarketEvent, OrderEvent, Side
 from quant_backtester.execution.simulated_execution import SimulatedExecutionHandler
 
+_TS = datetime(2020, 1, 1)
+
 
 def test_slippage_signs_and_latency_fill() -> None:
     exec_cfg = ExecutionConfig(
@@ -16,9 +18,7 @@ def test_slippage_signs_and_latency_fill() -> None:
     )
     ex = SimulatedExecutionHandler(commission_per_trade=1.0, cfg=exec_cfg, rng_seed=1)
 
-    mkt = MarketEvent(
-        timestamp=datetime(2020, 1, 1), symbol="AAPL", mid=100.0, spread_bps=10.0, volume=1000.0
-    )
+    mkt = MarketEvent(timestamp=_TS, symbol="AAPL", mid=100.0, spread_bps=10.0, volume=1000.0)
     ex.submit(OrderEvent(timestamp=mkt.timestamp, symbol="AAPL", side=Side.BUY, quantity=100))
     fills0 = ex.on_market(
         mkt
@@ -0,0 +1,26 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from quant_backtester.events import MarketEvent
+from quant_backtester.strategy.moving_average import MovingAverageCrossStrategy
+
+
+def test_precompute_signals_matches_online_path() -> None:
+    rng = np.random.default_rng(3)
+    mid = 100.0 + np.cumsum(rng.normal(0.0, 0.5, size=400))
+    start = datetime(2020, 1, 1)
+    timestamps = np.array(
+        [start + timedelta(minutes=i) for i in range(mid.size)], dtype="datetime64[us]"
+    )
+
+    online = MovingAverageCrossStrategy(symbols=("AAPL",), short_window=5, long_window=20)
+    expected = []
+    for ts, px in zip(timestamps.tolist(), mid.tolist(), strict=True):
+        signal = online.on_market(MarketEvent(timestamp=ts, symbol="AAPL", mid=px))
+        if signal is not None:
+            expected.append(signal)
+    assert expected, "fixture should produce at least one crossover"
+
+    batch = MovingAverageCrossStrategy(symbols=("AAPL",), short_window=5, long_window=20)
+    assert batch.precompute_signals("AAPL", mid, timestamps) == expected